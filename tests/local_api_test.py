@@ -1,16 +1,27 @@
+import asyncio
 import aiohttp
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 import pytest_asyncio
+from yarl import URL
 from watergate_local_api import WatergateLocalApiClient, WatergateApiException
+from watergate_local_api import watergate_api
 from watergate_local_api.models import DeviceState, NetworkingData, TelemetryData, AutoShutOffReport
 
-@pytest_asyncio.fixture
+# Every test shares the session-scoped event loop so that the client fixture
+# (and its connection pool) can be reused across the whole run
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client():
-    # Create and initialize the client within an async context
-    return WatergateLocalApiClient(base_url="http://testserver")
+    async with WatergateLocalApiClient(base_url="http://testserver") as client:
+        yield client
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    # Keep the retry path fast; the backoff itself is not under test
+    monkeypatch.setattr(watergate_api, "RETRY_BASE_DELAY", 0)
 
-@pytest.mark.asyncio
 async def test_get_device_state(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic/", payload={
@@ -35,7 +46,15 @@ async def test_get_device_state(client):
         assert device_state.uptime == 1024560
         assert device_state.water_meter.volume == 567820
 
-@pytest.mark.asyncio
+async def test_get_device_state_with_timeout_override(client):
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+
+        await client.async_get_device_state(timeout=5)
+        timeout = mock.requests[("GET", URL("http://testserver/api/sonic/"))][0].kwargs["timeout"]
+        assert timeout.total == 5
+        assert timeout.connect == min(5, watergate_api.CONNECT_TIMEOUT)
+
 async def test_get_networking(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic/networking", payload={
@@ -57,7 +76,6 @@ async def test_get_networking(client):
         assert networking_data.ssid == "MyWiFi"
         assert networking_data.rssi == -45
 
-@pytest.mark.asyncio
 async def test_get_telemetry_data(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic/telemetry", payload={
@@ -76,15 +94,64 @@ async def test_get_telemetry_data(client):
         assert telemetry_data.ongoing_event.duration == 90
         assert "flow" in telemetry_data.errors
 
-@pytest.mark.asyncio
+async def test_poll_all(client):
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+        mock.get("http://testserver/api/sonic/networking", payload={"ssid": "MyWiFi"})
+        mock.get("http://testserver/api/sonic/telemetry", status=403)
+        mock.get("http://testserver/api/sonic/auto-shut-off", payload={"enabled": True})
+        mock.get("http://testserver/api/sonic/auto-shut-off/report", status=204)
+
+        snapshot = await client.async_poll_all()
+        assert snapshot.device_state.valve_state == "open"
+        assert snapshot.networking.ssid == "MyWiFi"
+        assert snapshot.auto_shut_off.enabled is True
+        assert snapshot.auto_shut_off_report is None
+        # A failing endpoint does not fail the whole poll
+        assert snapshot.telemetry is None
+        assert isinstance(snapshot.errors["telemetry"], WatergateApiException)
+
+async def test_poll_all_with_invalid_json(client):
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+        mock.get("http://testserver/api/sonic/networking", payload={"ssid": "MyWiFi"})
+        mock.get("http://testserver/api/sonic/telemetry", body='{"flow": 68')
+        mock.get("http://testserver/api/sonic/auto-shut-off", payload={"enabled": True})
+        mock.get("http://testserver/api/sonic/auto-shut-off/report", status=204)
+
+        snapshot = await client.async_poll_all()
+        assert snapshot.device_state.valve_state == "open"
+        assert snapshot.telemetry is None
+        assert isinstance(snapshot.errors["telemetry"], WatergateApiException)
+
+async def test_poll_all_with_unexpected_json_shape(client):
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+        mock.get("http://testserver/api/sonic/networking", payload={"ssid": "MyWiFi"})
+        mock.get("http://testserver/api/sonic/telemetry", payload=[1, 2])
+        mock.get("http://testserver/api/sonic/auto-shut-off", payload={"enabled": True})
+        mock.get("http://testserver/api/sonic/auto-shut-off/report", status=204)
+
+        snapshot = await client.async_poll_all()
+        assert snapshot.networking.ssid == "MyWiFi"
+        assert snapshot.telemetry is None
+        assert isinstance(snapshot.errors["telemetry"].__cause__, AttributeError)
+
 async def test_patch_auto_shut_off(client):
     with aioresponses() as mock:
         mock.patch("http://testserver/api/sonic/auto-shut-off", status=204)
 
         result = await client.async_patch_auto_shut_off(enabled=True, duration=10, volume=5)
         assert result is True
+        request = mock.requests[("PATCH", URL("http://testserver/api/sonic/auto-shut-off"))][0]
+        assert request.kwargs["data"] == b'{"enabled":true,"durationThreshold":10,"volumeThreshold":5}'
+
+async def test_patch_auto_shut_off_without_settings(client):
+    with aioresponses() as mock:
+        with pytest.raises(ValueError):
+            await client.async_patch_auto_shut_off()
+        assert not mock.requests
 
-@pytest.mark.asyncio
 async def test_get_auto_shut_off(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic/auto-shut-off", payload={
@@ -96,7 +163,6 @@ async def test_get_auto_shut_off(client):
         assert report.volume_threshold == 300
         assert report.duration_threshold == 60
 
-@pytest.mark.asyncio
 async def test_get_auto_shut_off_report(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic/auto-shut-off/report", payload={
@@ -112,7 +178,6 @@ async def test_get_auto_shut_off_report(client):
         assert report.duration == 60
         assert report.timestamp == 1623456789
 
-@pytest.mark.asyncio
 async def test_set_webhook_url(client):
     with aioresponses() as mock:
         mock.put("http://testserver/api/sonic/webhook", status=204)
@@ -120,7 +185,6 @@ async def test_set_webhook_url(client):
         result = await client.async_set_webhook_url("http://webhook.url")
         assert result is True
 
-@pytest.mark.asyncio
 async def test_set_valve(client):
     with aioresponses() as mock:
         mock.put("http://testserver/api/sonic/valve", status=204)
@@ -128,15 +192,48 @@ async def test_set_valve(client):
         result = await client.async_set_valve_state("open")
         assert result is True
 
-@pytest.mark.asyncio
 async def test_retry_logic(client):
     with aioresponses() as mock:
-        mock.get("http://testserver/api/sonic", status=500)
+        mock.get("http://testserver/api/sonic/", status=500, repeat=True)
 
         with pytest.raises(WatergateApiException):
             await client.async_get_device_state()
+        assert len(mock.requests[("GET", URL("http://testserver/api/sonic/"))]) == len(watergate_api.RETRY_ATTEMPTS)
+
+async def test_get_retries_on_503(client):
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/auto-shut-off", status=503)
+        mock.get("http://testserver/api/sonic/auto-shut-off", payload={"enabled": True})
+
+        state = await client.async_get_auto_shut_off()
+        assert state.enabled is True
+        assert len(mock.requests[("GET", URL("http://testserver/api/sonic/auto-shut-off"))]) == 2
+
+async def test_set_valve_is_not_retried_on_503(client):
+    with aioresponses() as mock:
+        mock.put("http://testserver/api/sonic/valve", status=503, repeat=True)
+
+        with pytest.raises(WatergateApiException):
+            await client.async_set_valve_state("open")
+        assert len(mock.requests[("PUT", URL("http://testserver/api/sonic/valve"))]) == 1
+
+async def test_set_valve_network_error_is_chained(client):
+    with aioresponses() as mock:
+        mock.put("http://testserver/api/sonic/valve", exception=aiohttp.ClientConnectionError("refused"))
+
+        with pytest.raises(WatergateApiException, match="after 1 attempt$") as exc_info:
+            await client.async_set_valve_state("open")
+        assert isinstance(exc_info.value.__cause__, aiohttp.ClientConnectionError)
+
+async def test_patch_auto_shut_off_retries_on_503(client):
+    # The PATCH opts back into retries because its thresholds are absolute
+    with aioresponses() as mock:
+        mock.patch("http://testserver/api/sonic/auto-shut-off", status=503)
+        mock.patch("http://testserver/api/sonic/auto-shut-off", status=204)
+
+        assert await client.async_patch_auto_shut_off(enabled=False) is True
+        assert len(mock.requests[("PATCH", URL("http://testserver/api/sonic/auto-shut-off"))]) == 2
 
-@pytest.mark.asyncio
 async def test_custom_exception(client):
     with aioresponses() as mock:
         mock.get("http://testserver/api/sonic", exception=aiohttp.ClientError)
@@ -144,16 +241,23 @@ async def test_custom_exception(client):
         with pytest.raises(WatergateApiException):
             await client.async_get_device_state()
 
-@pytest.mark.asyncio
 async def test_api_rate_limit_handling(client):
     # Simulate API rate limit response (HTTP 429)
     with aioresponses() as mock:
-        mock.get("http://testserver/api/sonic", status=429)
+        mock.get("http://testserver/api/sonic/", status=429, repeat=True)
 
         with pytest.raises(WatergateApiException):
             await client.async_get_device_state()
 
-@pytest.mark.asyncio
+async def test_api_rate_limit_recovers(client):
+    # A single 429 honouring Retry-After should be retried transparently
+    with aioresponses() as mock:
+        mock.get("http://testserver/api/sonic/networking", status=429, headers={"Retry-After": "0"})
+        mock.get("http://testserver/api/sonic/networking", payload={"ip": "192.168.21.37"})
+
+        networking_data = await client.async_get_networking()
+        assert networking_data.ip == "192.168.21.37"
+
 async def test_get_networking_with_unexpected_status_code(client):
     # Simulate an unexpected status code (HTTP 403)
     with aioresponses() as mock:
@@ -161,17 +265,18 @@ async def test_get_networking_with_unexpected_status_code(client):
 
         with pytest.raises(WatergateApiException):
             await client.async_get_networking()
+        # Client errors are not retried
+        assert len(mock.requests[("GET", URL("http://testserver/api/sonic/networking"))]) == 1
 
-@pytest.mark.asyncio
 async def test_set_webhook_url_invalid_response(client):
     # Simulate an invalid response when setting webhook (e.g., status 400)
     with aioresponses() as mock:
-        mock.patch("http://testserver/api/sonic/webhook", status=400)
+        mock.put("http://testserver/api/sonic/webhook", status=400)
 
         with pytest.raises(WatergateApiException):
             await client.async_set_webhook_url("http://invalid-webhook.url")
+        assert len(mock.requests[("PUT", URL("http://testserver/api/sonic/webhook"))]) == 1
 
-@pytest.mark.asyncio
 async def test_auto_shut_off_report_with_missing_fields(client):
     # Response with some fields missing
     with aioresponses() as mock:
@@ -179,4 +284,55 @@ async def test_auto_shut_off_report_with_missing_fields(client):
 
         report = await client.async_get_auto_shut_off_report()
         assert report.type == "VOLUME_THRESHOLD"
-        assert report.volume is None  # Missing fields should default to None
\ No newline at end of file
+        assert report.volume is None  # Missing fields should default to None
+
+async def test_device_state_cache_is_invalidated_by_valve_change():
+    async with WatergateLocalApiClient(base_url="http://testserver", cache_ttl=60) as client:
+        with aioresponses() as mock:
+            mock.get("http://testserver/api/sonic/", payload={"valveState": "closed"})
+            mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+            mock.put("http://testserver/api/sonic/valve", status=204)
+
+            assert (await client.async_get_device_state()).valve_state == "closed"
+            # Served from cache, the second mocked response is not consumed
+            assert (await client.async_get_device_state()).valve_state == "closed"
+
+            await client.async_set_valve_state("open")
+            assert (await client.async_get_device_state()).valve_state == "open"
+
+async def test_device_state_cache_ignores_fetch_overlapping_valve_change():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_closed_state(url, **kwargs):
+        started.set()
+        await release.wait()
+        return CallbackResult(payload={"valveState": "closed"})
+
+    async with WatergateLocalApiClient(base_url="http://testserver", cache_ttl=60) as client:
+        with aioresponses() as mock:
+            mock.get("http://testserver/api/sonic/", callback=slow_closed_state)
+            mock.get("http://testserver/api/sonic/", payload={"valveState": "open"})
+            mock.put("http://testserver/api/sonic/valve", status=204)
+
+            in_flight = asyncio.create_task(client.async_get_device_state())
+            await started.wait()
+            await client.async_set_valve_state("open")
+            release.set()
+            assert (await in_flight).valve_state == "closed"
+
+            # The fetch started before the valve change must not be cached
+            assert (await client.async_get_device_state()).valve_state == "open"
+
+async def test_get_telemetry_data_not_modified(client):
+    url = "http://testserver/api/sonic/telemetry"
+    with aioresponses() as mock:
+        mock.get(url, payload={"flow": 6800, "pressure": 2320, "temperature": 23.5}, headers={"ETag": '"abc"'})
+        mock.get(url, status=304)
+
+        first = await client.async_get_telemetry_data()
+        second = await client.async_get_telemetry_data()
+        # The model parsed from the first response is reused as-is
+        assert second is first
+        assert second.flow == 6800
+        assert mock.requests[("GET", URL(url))][1].kwargs["headers"]["If-None-Match"] == '"abc"'
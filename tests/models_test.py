@@ -1,5 +1,5 @@
 import pytest
-from watergate_local_api.models import TelemetryData, DeviceState
+from watergate_local_api.models import TelemetryData, DeviceState, WebhookEvent
 
 
 def test_telemetry_data_should_be_able_build_without_ongoing_even():
@@ -21,4 +21,14 @@ def test_device_state_should_be_able_to_build_when_there_is_no_water_meter():
     assert device_state.uptime == 1234
     assert device_state.water_meter is None
     assert device_state.serial_number == "123123"
-    
\ No newline at end of file
+
+def test_webhook_event_should_be_parsed_by_type():
+    event = WebhookEvent.parse_webhook_event({"type": "valve", "data": {"state": "closing"}})
+    assert event.state == "closing"
+    assert WebhookEvent.parse_webhook_event({"type": "online"}).type == "online"
+    with pytest.raises(ValueError):
+        WebhookEvent.parse_webhook_event({"type": "unknown"})
+
+def test_telemetry_webhook_event_should_be_hashable():
+    event = WebhookEvent.parse_webhook_event({"type": "telemetry", "data": {"flow": 6800, "errors": ["flow"]}})
+    assert event in {event}
@@ -1,2 +1,3 @@
-from .watergate_api import WatergateLocalApiClient
-from .watergate_api import WatergateApiException
\ No newline at end of file
+from .watergate_api import WatergateLocalApiClient, WatergateApiException
+
+__all__ = ("WatergateLocalApiClient", "WatergateApiException")
@@ -3,4 +3,25 @@ from .networking import NetworkingData
 from .telemetry_data import TelemetryData
 from .auto_shut_off_state import AutoShutOffState
 from .auto_shut_off_report import AutoShutOffReport
-from .webhook_model import WebhookEvent
+from .poll_snapshot import PollSnapshot
+from .water_meter import WaterMeter
+
+__all__ = (
+    "DeviceState",
+    "NetworkingData",
+    "TelemetryData",
+    "AutoShutOffState",
+    "AutoShutOffReport",
+    "PollSnapshot",
+    "WaterMeter",
+    "WebhookEvent",
+)
+
+
+def __getattr__(name: str):
+    """Import the webhook models on first use, the API client does not need them."""
+    if name == "WebhookEvent":
+        from .webhook_model import WebhookEvent
+        globals()[name] = WebhookEvent
+        return WebhookEvent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
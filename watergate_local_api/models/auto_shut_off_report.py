@@ -6,6 +6,8 @@ VOLUME_FIELD = "volume"
 class AutoShutOffReport:
     """Represents auto shut off report."""
 
+    __slots__ = ("timestamp", "type", "duration", "volume")
+
     def __init__(
         self,
         timestamp: int,
@@ -22,9 +24,10 @@ class AutoShutOffReport:
     @classmethod
     def from_dict(cls, data: dict):
         """Create an Auto Shut Off Report object from dictionary."""
+        get = data.get
         return cls(
-            timestamp=data.get(TIMESTAMP_FIELD),
-            type=data.get(TYPE_FIELD),
-            duration=data.get(DURATION_FIELD),
-            volume=data.get(VOLUME_FIELD)
+            get(TIMESTAMP_FIELD),
+            get(TYPE_FIELD),
+            get(DURATION_FIELD),
+            get(VOLUME_FIELD),
         )
\ No newline at end of file
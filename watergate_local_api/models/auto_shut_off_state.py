@@ -5,6 +5,8 @@ DURATION_THRESHOLD_FIELD = "durationThreshold"
 class AutoShutOffState:
     """Represents Auto Shut Off state."""
 
+    __slots__ = ("enabled", "volume_threshold", "duration_threshold")
+
     def __init__(
         self,
         enabled: bool,
@@ -19,8 +21,9 @@ class AutoShutOffState:
     @classmethod
     def from_dict(cls, data: dict):
         """Create an Auto Shut Off object from a dictionary."""
+        get = data.get
         return cls(
-            enabled=data.get(ENABLED_FIELD),
-            volume_threshold=data.get(VOLUME_THRESHOLD_FIELD),
-            duration_threshold=data.get(DURATION_THRESHOLD_FIELD),
+            get(ENABLED_FIELD),
+            get(VOLUME_THRESHOLD_FIELD),
+            get(DURATION_THRESHOLD_FIELD),
         )
\ No newline at end of file
@@ -9,10 +9,24 @@ FIRMWARE_VERSION_FIELD = "firmwareVersion"
 SERIAL_NUMBER_FIELD = "serialNumber"
 UPTIME_FIELD = "uptime"
 WATER_METER_FIELD = "waterMeter"
+WATER_METER_VOLUME_FIELD = "volume"
+WATER_METER_DURATION_FIELD = "duration"
 
 class DeviceState:
     """Represents the device state."""
 
+    __slots__ = (
+        "valve_state",
+        "water_flow_indicator",
+        "mqtt_status",
+        "wifi_status",
+        "power_supply",
+        "firmware_version",
+        "uptime",
+        "water_meter",
+        "serial_number",
+    )
+
     def __init__(
         self,
         valve_state: str,
@@ -40,14 +54,19 @@ class DeviceState:
     @classmethod
     def from_dict(cls, data: dict):
         """Create an Device State object from a dictionary."""
+        get = data.get
+        water_meter = get(WATER_METER_FIELD)
         return cls(
-            valve_state=data.get(VALVE_STATE_FIELD),
-            water_flow_indicator=data.get(WATER_FLOW_INDICATOR_FIELD),
-            mqtt_status=data.get(MQTT_STATUS_FIELD),
-            wifi_status=data.get(WIFI_STATUS_FIELD),
-            power_supply=data.get(POWER_SUPPLY_FIELD),
-            firmware_version=data.get(FIRMWARE_VERSION_FIELD),
-            serial_number=data.get(SERIAL_NUMBER_FIELD),
-            uptime=data.get(UPTIME_FIELD),
-            water_meter=WaterMeter(**data.get(WATER_METER_FIELD)) if data.get(WATER_METER_FIELD) else None
+            get(VALVE_STATE_FIELD),
+            get(WATER_FLOW_INDICATOR_FIELD),
+            get(MQTT_STATUS_FIELD),
+            get(WIFI_STATUS_FIELD),
+            get(POWER_SUPPLY_FIELD),
+            get(FIRMWARE_VERSION_FIELD),
+            get(UPTIME_FIELD),
+            WaterMeter(
+                water_meter.get(WATER_METER_VOLUME_FIELD),
+                water_meter.get(WATER_METER_DURATION_FIELD),
+            ) if water_meter else None,
+            get(SERIAL_NUMBER_FIELD),
         )
\ No newline at end of file
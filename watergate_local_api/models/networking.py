@@ -11,6 +11,18 @@ MQTT_UPTIME_FIELD = "mqttUpTime"
 class NetworkingData:
     """Represents networking data."""
 
+    __slots__ = (
+        "mqtt_connected",
+        "wifi_connected",
+        "ip",
+        "gateway",
+        "subnet",
+        "ssid",
+        "rssi",
+        "wifi_uptime",
+        "mqtt_uptime",
+    )
+
     def __init__(
         self,
         mqtt_connected: bool,
@@ -37,14 +49,15 @@ class NetworkingData:
     @classmethod
     def from_dict(cls, data: dict):
         """Create an Networking from a dictionary."""
+        get = data.get
         return cls(
-            mqtt_connected=data.get(MQTT_CONNECTED_FIELD),
-            wifi_connected=data.get(WIFI_CONNECTED_FIELD),
-            ip=data.get(IP_FIELD),
-            gateway=data.get(GATEWAY_FIELD),
-            subnet=data.get(SUBNET_FIELD),
-            ssid=data.get(SSID_FIELD),
-            rssi=data.get(RSSI_FIELD),
-            wifi_uptime=data.get(WIFI_UPTIME_FIELD),
-            mqtt_uptime=data.get(MQTT_UPTIME_FIELD),
+            get(MQTT_CONNECTED_FIELD),
+            get(WIFI_CONNECTED_FIELD),
+            get(IP_FIELD),
+            get(GATEWAY_FIELD),
+            get(SUBNET_FIELD),
+            get(SSID_FIELD),
+            get(RSSI_FIELD),
+            get(WIFI_UPTIME_FIELD),
+            get(MQTT_UPTIME_FIELD),
         )
\ No newline at end of file
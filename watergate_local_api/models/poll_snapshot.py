@@ -0,0 +1,40 @@
+from typing import Optional
+
+from .auto_shut_off_report import AutoShutOffReport
+from .auto_shut_off_state import AutoShutOffState
+from .device_state import DeviceState
+from .networking import NetworkingData
+from .telemetry_data import TelemetryData
+
+class PollSnapshot:
+    """Represents the result of polling all device endpoints at once."""
+
+    __slots__ = (
+        "device_state",
+        "networking",
+        "telemetry",
+        "auto_shut_off",
+        "auto_shut_off_report",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        device_state: Optional[DeviceState],
+        networking: Optional[NetworkingData],
+        telemetry: Optional[TelemetryData],
+        auto_shut_off: Optional[AutoShutOffState],
+        auto_shut_off_report: Optional[AutoShutOffReport],
+        errors: dict[str, Exception],
+    ) -> None:
+        """Create a Poll Snapshot object.
+
+        Endpoints that could not be fetched are None, with the exception that
+        caused it stored in errors under the same name.
+        """
+        self.device_state = device_state
+        self.networking = networking
+        self.telemetry = telemetry
+        self.auto_shut_off = auto_shut_off
+        self.auto_shut_off_report = auto_shut_off_report
+        self.errors = errors
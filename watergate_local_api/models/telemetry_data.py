@@ -5,10 +5,14 @@ PRESSURE_FIELD = "pressure"
 TEMPERATURE_FIELD = "temperature"
 EVENT_FIELD = "event"
 ERRORS_FIELD = "errors"
+EVENT_VOLUME_FIELD = "volume"
+EVENT_DURATION_FIELD = "duration"
 
 class TelemetryData:
     """Represents telemetry data."""
 
+    __slots__ = ("flow", "pressure", "water_temperature", "ongoing_event", "errors")
+
     def __init__(
         self,
         flow: float,
@@ -27,10 +31,12 @@ class TelemetryData:
     @classmethod
     def from_dict(cls, data: dict):
         """Create an Telemetry Data object from a dictionary."""
+        get = data.get
+        event = get(EVENT_FIELD)
         return cls(
-            flow=data.get(FLOW_FIELD),
-            pressure=data.get(PRESSURE_FIELD),
-            water_temperature=data.get(TEMPERATURE_FIELD),
-            ongoing_event=Event(**data.get(EVENT_FIELD)) if data.get(EVENT_FIELD) else None,
-            errors=data.get(ERRORS_FIELD)
+            get(FLOW_FIELD),
+            get(PRESSURE_FIELD),
+            get(TEMPERATURE_FIELD),
+            Event(event.get(EVENT_VOLUME_FIELD), event.get(EVENT_DURATION_FIELD)) if event else None,
+            get(ERRORS_FIELD),
         )
\ No newline at end of file
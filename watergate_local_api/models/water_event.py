@@ -1,6 +1,8 @@
 class Event:
     """Represents the water event."""
 
+    __slots__ = ("volume", "duration")
+
     def __init__(self, volume: int, duration: int) -> None:
         """Create an water event object."""
 
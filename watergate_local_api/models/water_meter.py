@@ -1,6 +1,8 @@
 class WaterMeter:
     """Represents the water meter."""
 
+    __slots__ = ("volume", "duration")
+
     def __init__(self, volume: int, duration: int) -> None:
         """Create an Water Meter object."""
 
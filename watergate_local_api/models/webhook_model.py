@@ -1,3 +1,5 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional, List, Dict, Union
 
 # Constants for field names
@@ -18,144 +20,120 @@ TEMPERATURE_FIELD = "temperature"
 EVENT_FIELD = "event"
 ERRORS_FIELD = "errors"
 
+# Shared read-only default for events sent without a data payload
+_EMPTY_DATA = MappingProxyType({})
 
+
+@dataclass(slots=True, frozen=True)
 class AutoShutOffReportData:
-    """Represents data for the auto-shut-off report webhook event."""
-    
-    def __init__(self, event_type: str, volume: int, duration: int, timestamp: int):
-        """
-        Initialize the AutoShutOffReportData object.
-        
-        :param event_type: Type of the auto-shut-off event ("VOLUME_THRESHOLD" or "DURATION_THRESHOLD").
-        :param volume: Volume of water in liters when the event occurred.
-        :param duration: Duration in minutes when the event occurred.
-        :param timestamp: Timestamp in milliseconds of the event occurrence.
-        """
-        self.type = event_type
-        self.volume = volume
-        self.duration = duration
-        self.timestamp = timestamp
+    """
+    Represents data for the auto-shut-off report webhook event.
+
+    :param type: Type of the auto-shut-off event ("VOLUME_THRESHOLD" or "DURATION_THRESHOLD").
+    :param volume: Volume of water in liters when the event occurred.
+    :param duration: Duration in minutes when the event occurred.
+    :param timestamp: Timestamp in milliseconds of the event occurrence.
+    """
+
+    type: str
+    volume: int
+    duration: int
+    timestamp: int
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create an AutoShutOffReportData object from a dictionary."""
-        return cls(
-            event_type=data.get(TYPE_FIELD),
-            volume=data.get(VOLUME_FIELD),
-            duration=data.get(DURATION_FIELD),
-            timestamp=data.get(TIMESTAMP_FIELD)
-        )
+        get = data.get
+        return cls(get(TYPE_FIELD), get(VOLUME_FIELD), get(DURATION_FIELD), get(TIMESTAMP_FIELD))
 
 
+@dataclass(slots=True, frozen=True)
 class TelemetryEventData:
-    """Represents data for the telemetry webhook event."""
-    
-    def __init__(
-        self,
-        flow: Optional[int] = None,
-        pressure: Optional[int] = None,
-        temperature: Optional[float] = None,
-        event: Optional[Dict[str, int]] = None,
-        errors: Optional[List[str]] = None,
-    ):
-        """
-        Initialize the TelemetryEventData object.
-        
-        :param flow: Flow rate in ml/min.
-        :param pressure: Pressure in mbar.
-        :param temperature: Temperature in °C.
-        :param event: Event-specific data containing volume and duration.
-        :param errors: List of errors, if any (e.g., "flow", "pressure", "temperature").
-        """
-        self.flow = flow
-        self.pressure = pressure
-        self.temperature = temperature
-        self.event = event
-        self.errors = errors
+    """
+    Represents data for the telemetry webhook event.
+
+    :param flow: Flow rate in ml/min.
+    :param pressure: Pressure in mbar.
+    :param temperature: Temperature in °C.
+    :param event: Event-specific data containing volume and duration.
+    :param errors: List of errors, if any (e.g., "flow", "pressure", "temperature").
+    """
+
+    flow: Optional[int] = None
+    pressure: Optional[int] = None
+    temperature: Optional[float] = None
+    # The payload containers are mutable, so keep them out of the hash
+    event: Optional[Dict[str, int]] = field(default=None, hash=False)
+    errors: Optional[List[str]] = field(default=None, hash=False)
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create a TelemetryEventData object from a dictionary."""
-        return cls(
-            flow=data.get(FLOW_FIELD),
-            pressure=data.get(PRESSURE_FIELD),
-            temperature=data.get(TEMPERATURE_FIELD),
-            event=data.get(EVENT_FIELD),
-            errors=data.get(ERRORS_FIELD)
-        )
+        get = data.get
+        return cls(get(FLOW_FIELD), get(PRESSURE_FIELD), get(TEMPERATURE_FIELD), get(EVENT_FIELD), get(ERRORS_FIELD))
 
 
+@dataclass(slots=True, frozen=True)
 class ValveEventData:
-    """Represents data for the valve state change webhook event."""
-    
-    def __init__(self, state: str):
-        """
-        Initialize the ValveEventData object.
-        
-        :param state: State of the valve ("open", "closed", "opening", or "closing").
-        """
-        self.state = state
+    """
+    Represents data for the valve state change webhook event.
+
+    :param state: State of the valve ("open", "closed", "opening", or "closing").
+    """
+
+    state: str
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create a ValveEventData object from a dictionary."""
-        return cls(
-            state=data.get(VALVE_STATE_FIELD)
-        )
+        return cls(data.get(VALVE_STATE_FIELD))
 
 
+@dataclass(slots=True, frozen=True)
 class PowerSupplyChangedEventData:
-    """Represents data for the power supply change webhook event."""
-    
-    def __init__(self, supply: str):
-        """
-        Initialize the PowerSupplyChangedEventData object.
-        
-        :param supply: Type of power supply ("battery", "external", or "external+battery").
-        """
-        self.supply = supply
+    """
+    Represents data for the power supply change webhook event.
+
+    :param supply: Type of power supply ("battery", "external", or "external+battery").
+    """
+
+    supply: str
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create a PowerSupplyChangedEventData object from a dictionary."""
-        return cls(
-            supply=data.get(SUPPLY_FIELD)
-        )
+        return cls(data.get(SUPPLY_FIELD))
 
 
+@dataclass(slots=True, frozen=True)
 class WifiChangedEventData:
-    """Represents data for the WiFi configuration change webhook event."""
-    
-    def __init__(self, ip: str, gateway: str, subnet: str, ssid: str, rssi: int):
-        """
-        Initialize the WifiChangedEventData object.
-        
-        :param ip: IP address of the device.
-        :param gateway: Gateway IP address.
-        :param subnet: Subnet mask.
-        :param ssid: SSID of the connected WiFi network.
-        :param rssi: Received Signal Strength Indicator (RSSI) in dBm.
-        """
-        self.ip = ip
-        self.gateway = gateway
-        self.subnet = subnet
-        self.ssid = ssid
-        self.rssi = rssi
+    """
+    Represents data for the WiFi configuration change webhook event.
+
+    :param ip: IP address of the device.
+    :param gateway: Gateway IP address.
+    :param subnet: Subnet mask.
+    :param ssid: SSID of the connected WiFi network.
+    :param rssi: Received Signal Strength Indicator (RSSI) in dBm.
+    """
+
+    ip: str
+    gateway: str
+    subnet: str
+    ssid: str
+    rssi: int
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create a WifiChangedEventData object from a dictionary."""
-        return cls(
-            ip=data.get(IP_FIELD),
-            gateway=data.get(GATEWAY_FIELD),
-            subnet=data.get(SUBNET_FIELD),
-            ssid=data.get(SSID_FIELD),
-            rssi=data.get(RSSI_FIELD)
-        )
+        get = data.get
+        return cls(get(IP_FIELD), get(GATEWAY_FIELD), get(SUBNET_FIELD), get(SSID_FIELD), get(RSSI_FIELD))
 
 
 class OnlineEvent:
     """Represents an online status webhook event with no specific data."""
+
+    __slots__ = ("type",)
     
     def __init__(self):
         """
@@ -171,8 +149,21 @@ class OnlineEvent:
         return cls()
 
 
+# Webhook event type to the parser of its data payload
+_EVENT_PARSERS = {
+    "auto-shut-off-report": AutoShutOffReportData.from_dict,
+    "telemetry": TelemetryEventData.from_dict,
+    "valve": ValveEventData.from_dict,
+    "power-supply-changed": PowerSupplyChangedEventData.from_dict,
+    "wifi-changed": WifiChangedEventData.from_dict,
+    "online": OnlineEvent.from_dict,
+}
+
+
 class WebhookEvent:
     """Base class for all webhook events."""
+
+    __slots__ = ("type", "data")
     
     def __init__(self, event_type: str, data: dict):
         """
@@ -205,19 +196,7 @@ class WebhookEvent:
         :raises ValueError: If the event type is unknown.
         """
         event_type = data.get("type")
-        event_data = data.get("data", {})
-        
-        if event_type == "auto-shut-off-report":
-            return AutoShutOffReportData.from_dict(event_data)
-        elif event_type == "telemetry":
-            return TelemetryEventData.from_dict(event_data)
-        elif event_type == "valve":
-            return ValveEventData.from_dict(event_data)
-        elif event_type == "power-supply-changed":
-            return PowerSupplyChangedEventData.from_dict(event_data)
-        elif event_type == "wifi-changed":
-            return WifiChangedEventData.from_dict(event_data)
-        elif event_type == "online":
-            return OnlineEvent.from_dict({})
-        else:
+        parser = _EVENT_PARSERS.get(event_type)
+        if parser is None:
             raise ValueError(f"Unknown event type: {event_type}")
+        return parser(data.get("data", _EMPTY_DATA))
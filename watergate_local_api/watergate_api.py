@@ -1,23 +1,42 @@
+import functools
 import logging
-import json
-from typing import Optional
+import random
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
 
 import aiohttp
 import asyncio
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    # orjson is optional, fall back to the standard library with orjson's compact UTF-8 output
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
 from .models import (
     DeviceState,
     NetworkingData,
     TelemetryData,
     AutoShutOffState,
-    AutoShutOffReport
+    AutoShutOffReport,
+    PollSnapshot
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 ACCEPT_HEADER = "Accept"
 CONTENT_TYPE_HEADER = "Content-Type"
+RETRY_AFTER_HEADER = "Retry-After"
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
 
+DEVICE_STATE_URL = "/"
 NETWORKING_URL = "/networking"
 VALVE_URL = "/valve"
 TELEMETRY_URL = "/telemetry"
@@ -25,158 +44,360 @@ AUTO_SHUT_OFF_URL = "/auto-shut-off"
 AUTO_SHUT_OFF_REPORT_URL = "/auto-shut-off/report"
 WEBHOOK_URL = "/webhook"
 
-RETRY_ATTEMPTS = range(3)
+# Headers are the same on every call, so share one read-only mapping per endpoint
+DEVICE_STATE_HEADERS = MappingProxyType({ACCEPT_HEADER: "application/vnd.wtg.local.device-state.v1+json"})
+NETWORKING_HEADERS = MappingProxyType({ACCEPT_HEADER: "application/vnd.wtg.local.networking.v1+json"})
+TELEMETRY_HEADERS = MappingProxyType({ACCEPT_HEADER: "application/vnd.wtg.local.telemetry.v1+json"})
+AUTO_SHUT_OFF_HEADERS = MappingProxyType({ACCEPT_HEADER: "application/vnd.wtg.local.auto-shut-off.v1+json"})
+AUTO_SHUT_OFF_PATCH_HEADERS = MappingProxyType({CONTENT_TYPE_HEADER: "application/vnd.wtg.local.auto-shut-off.v1+json"})
+AUTO_SHUT_OFF_REPORT_HEADERS = MappingProxyType({ACCEPT_HEADER: "application/vnd.wtg.local.auto-shut-off.report.v1+json"})
+WEBHOOK_HEADERS = MappingProxyType({CONTENT_TYPE_HEADER: "application/vnd.wtg.local.webhook.v1+json"})
+VALVE_HEADERS = MappingProxyType({CONTENT_TYPE_HEADER: "application/vnd.wtg.local.valve-change.v1+json"})
+
+RETRY_ATTEMPTS = (0, 1, 2, 3, 4)
+OK_STATUSES = (200, 204)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Reads are retried by default; writes only when the caller marks them safe to replay
+RETRY_METHODS = ("GET", "HEAD")
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 8
+RETRY_MAX_ELAPSED = 30
+
+# Attribute names of PollSnapshot, in the order async_poll_all fetches them
+POLL_FIELDS = ("device_state", "networking", "telemetry", "auto_shut_off", "auto_shut_off_report")
+
+# The device is a single LAN host, so a handful of keep-alive connections is enough;
+# one per endpoint lets async_poll_all run without queueing.
+DEFAULT_MAX_CONNECTIONS = 5
+DEFAULT_DNS_CACHE_TTL = 600
+CONNECT_TIMEOUT = 3
+# Device responses are well under 1 KB, aiohttp's 64 KB default is oversized
+READ_BUFSIZE = 2048
 
 class WatergateApiException(Exception):
     """Custom exception for critical errors in WatergateLocalApiClient."""
     pass
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds, ignoring anything else."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+def _cached(key: str):
+    """Serve the decorated GET from the client's TTL cache when caching is enabled.
+
+    A result is only stored if no write invalidated the key while it was being
+    fetched, so a GET that overlaps a write cannot put the old state back.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not self._cache_ttl:
+                return await func(self, *args, **kwargs)
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+            generation = self._cache_generations.get(key, 0)
+            result = await func(self, *args, **kwargs)
+            if self._cache_generations.get(key, 0) == generation:
+                self._cache[key] = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
+
 class WatergateLocalApiClient:
     """API Client for interacting with the external service."""
 
-    def __init__(self, base_url: str, timeout: int = 10) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 10,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        cache_ttl: float = 0,
+    ) -> None:
+        """Initialize the API client.
+
+        When cache_ttl is positive, device state, networking and auto shut off
+        responses are reused for that many seconds instead of querying the device.
+        """
         self._base_url = base_url + "/api/sonic"
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # The URLs never change for a client, so build them once
+        self._device_state_url = self._base_url + DEVICE_STATE_URL
+        self._networking_url = self._base_url + NETWORKING_URL
+        self._telemetry_url = self._base_url + TELEMETRY_URL
+        self._auto_shut_off_url = self._base_url + AUTO_SHUT_OFF_URL
+        self._auto_shut_off_report_url = self._base_url + AUTO_SHUT_OFF_REPORT_URL
+        self._webhook_url = self._base_url + WEBHOOK_URL
+        self._valve_url = self._base_url + VALVE_URL
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=min(timeout, CONNECT_TIMEOUT))
+        self._max_connections = max_connections
+        self._dns_cache_ttl = dns_cache_ttl
         self._session = None
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache_generations: dict[str, int] = {}
+        self._etags: dict[str, tuple[str, Any]] = {}
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Ensure the session is open, creating it if necessary.
+
+        The session is kept for the lifetime of the client so that keep-alive
+        connections to the device are reused between requests.
+        """
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+        connector = aiohttp.TCPConnector(
+            limit=self._max_connections,
+            limit_per_host=self._max_connections,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+            keepalive_timeout=75,
+        )
+        self._session = aiohttp.ClientSession(
+            timeout=self._timeout,
+            connector=connector,
+            read_bufsize=READ_BUFSIZE,
+        )
+        _LOGGER.debug("Created a new aiohttp session.")
+        return self._session
 
-    async def _ensure_session(self):
-        """Ensure the session is open, creating it if necessary."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout, json_serialize=lambda data: json.dumps(data, separators=(',', ':')))
-            _LOGGER.debug("Created a new aiohttp session.")
+    def _request_timeout(self, timeout: Optional[float]) -> aiohttp.ClientTimeout:
+        """Return the per-call timeout, falling back to the session-level one."""
+        if timeout is None:
+            return self._timeout
+        return aiohttp.ClientTimeout(total=timeout, connect=min(timeout, CONNECT_TIMEOUT))
 
     async def __aenter__(self):
         """Enter the context and create the session."""
-        await self._ensure_session()  # Ensure session is created on enter
+        self._ensure_session()  # Ensure session is created on enter
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         """Exit the context and close the session."""
         await self.async_close()
 
-    async def _get(self, url: str, headers: dict) -> Optional[dict]:
-        """Helper method to perform GET requests."""
-        await self._ensure_session()
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[dict] = None,
+        *,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[dict], Any]] = None,
+        retry: Optional[bool] = None,
+    ) -> Any:
+        """Perform a request, retrying transient failures with exponential backoff.
 
-        for attempt in RETRY_ATTEMPTS:  # Retry logic
-            try:
-                response = await self._session.get(url, headers=headers)
-                if response.status == 200:
-                    return await response.json()
-                _LOGGER.error("Failed to fetch data from %s: %s", url, response.status)
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                _LOGGER.error("Network error occurred: %s", e)
-            await asyncio.sleep(1)
-        raise WatergateApiException(f"Failed to fetch data from {url} after 3 attempts")
-
-    async def _put(self, url: str, headers: dict, data: dict) -> bool:
-        _LOGGER.debug("PUT %s with data: %s and headers: %s", url, data, headers)
-        await self._ensure_session()
-        for attempt in RETRY_ATTEMPTS:  # Retry logic
+        Returns the decoded JSON body for a 200 response and None for 204 (for
+        example when there is no auto shut off report yet). When a decode
+        callable is given, a non-empty body is passed through it. A body that
+        is not valid JSON, or that the decode callable rejects, raises
+        WatergateApiException. Rate limiting (429), server errors and network
+        errors are retried for GET and HEAD, or for any method when retry is
+        set explicitly; any other status raises immediately.
+
+        GET requests are made conditional on the last ETag seen for the URL, and
+        a 304 answer returns the result stored alongside that ETag.
+        """
+        _LOGGER.debug("%s %s", method, url)
+        session = self._ensure_session()
+        request_timeout = self._request_timeout(timeout)
+        deadline = time.monotonic() + RETRY_MAX_ELAPSED
+        # Serialize the body once; the endpoint headers already carry its Content-Type
+        request_body = _json_dumps(data) if data is not None else None
+        if retry is None:
+            retry = method in RETRY_METHODS
+        attempts = RETRY_ATTEMPTS if retry else RETRY_ATTEMPTS[:1]
+
+        cached = self._etags.get(url) if method == "GET" else None
+        if cached is not None:
+            headers = {**headers, IF_NONE_MATCH_HEADER: cached[0]}
+
+        error = None
+        for attempt in attempts:
+            retry_after = None
             try:
-                async with self._session.put(url, json=data, headers=headers) as response:
-                    if response.status == 204 or response.status == 200:
-                        return True
-                _LOGGER.error("Failed to put data %s, %s, %s: %s", url, data, headers, response.status)
+                async with session.request(
+                    method, url, headers=headers, data=request_body, timeout=request_timeout
+                ) as response:
+                    if response.status == 304 and cached is not None:
+                        return cached[1]
+                    if response.status in OK_STATUSES:
+                        payload = None
+                        if response.status == 200:
+                            # Decode the raw bytes directly, skipping aiohttp's text decoding
+                            raw = await response.read()
+                            try:
+                                payload = _json_loads(raw) if raw else None
+                            except ValueError as e:
+                                _LOGGER.error("Invalid JSON from %s %s: %s", method, url, e)
+                                raise WatergateApiException(f"Invalid JSON from {method} {url}") from e
+                        if decode is not None:
+                            try:
+                                payload = decode(payload) if payload else None
+                            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                                # Valid JSON of the wrong shape, e.g. a list instead of an object
+                                _LOGGER.error("Unexpected response from %s %s: %s", method, url, e)
+                                raise WatergateApiException(f"Unexpected response from {method} {url}") from e
+                        if method == "GET":
+                            self._store_etag(url, response.headers.get(ETAG_HEADER), payload)
+                        return payload
+                    _LOGGER.error("Failed to %s %s: %s", method, url, response.status)
+                    if response.status not in RETRY_STATUSES:
+                        raise WatergateApiException(f"Failed to {method} {url}: {response.status}")
+                    retry_after = _parse_retry_after(response.headers.get(RETRY_AFTER_HEADER))
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                _LOGGER.error("Network error occurred: %s", e)
-            await asyncio.sleep(1)
-        raise WatergateApiException(f"Failed to put data to {url} after 3 attempts")
+                _LOGGER.error("Network error occurred on %s %s: %s", method, url, e)
+                error = e
+            else:
+                error = None
+
+            if attempt == attempts[-1]:
+                break
+            delay = retry_after
+            if delay is None:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (1 << attempt)) + random.random() * RETRY_BASE_DELAY
+            if time.monotonic() + delay > deadline:
+                break
+            await asyncio.sleep(delay)
+        attempts_made = "1 attempt" if attempt == 0 else f"{attempt + 1} attempts"
+        raise WatergateApiException(f"Failed to {method} {url} after {attempts_made}") from error
+
+    def _invalidate(self, key: str) -> None:
+        """Drop the cached result for key and discard fetches already in flight."""
+        self._cache.pop(key, None)
+        self._cache_generations[key] = self._cache_generations.get(key, 0) + 1
+
+    def _store_etag(self, url: str, etag: Optional[str], payload: Any) -> None:
+        """Remember the ETag and result of a GET response for conditional requests."""
+        if etag:
+            self._etags[url] = (etag, payload)
+        else:
+            self._etags.pop(url, None)
 
     async def async_close(self):
         """Explicitly close the session."""
         if self._session and not self._session.closed:
             await self._session.close()
             _LOGGER.debug("Closed the aiohttp session.")
+        self._session = None
 
-    async def async_get_device_state(self) -> Optional[DeviceState]:
+    @_cached(DEVICE_STATE_URL)
+    async def async_get_device_state(self, timeout: Optional[float] = None) -> Optional[DeviceState]:
         """GET /api/sonic/ - Get device state."""
-        headers = {ACCEPT_HEADER: "application/vnd.wtg.local.device-state.v1+json"}
-        data = await self._get(self._base_url + "/", headers)
-        return DeviceState.from_dict(data) if data else None
+        return await self._request(
+            "GET", self._device_state_url, DEVICE_STATE_HEADERS, timeout=timeout, decode=DeviceState.from_dict
+        )
 
-    async def async_get_networking(self) -> Optional[NetworkingData]:
+    @_cached(NETWORKING_URL)
+    async def async_get_networking(self, timeout: Optional[float] = None) -> Optional[NetworkingData]:
         """GET /api/sonic/networking - Get networking."""
-        url = self._base_url + NETWORKING_URL
-        headers = {ACCEPT_HEADER: "application/vnd.wtg.local.networking.v1+json"}
-        data = await self._get(url, headers)
-        return NetworkingData.from_dict(data) if data else None
+        return await self._request(
+            "GET", self._networking_url, NETWORKING_HEADERS, timeout=timeout, decode=NetworkingData.from_dict
+        )
 
-    async def async_get_telemetry_data(self) -> Optional[TelemetryData]:
+    async def async_get_telemetry_data(self, timeout: Optional[float] = None) -> Optional[TelemetryData]:
         """GET /api/sonic/telemetry - Get telemetry data."""
-        url = self._base_url + TELEMETRY_URL
-        headers = {ACCEPT_HEADER: "application/vnd.wtg.local.telemetry.v1+json"}
-        data = await self._get(url, headers)
-        return TelemetryData.from_dict(data) if data else None
+        return await self._request(
+            "GET", self._telemetry_url, TELEMETRY_HEADERS, timeout=timeout, decode=TelemetryData.from_dict
+        )
 
-    async def async_get_auto_shut_off(self) -> Optional[AutoShutOffState]:
+    @_cached(AUTO_SHUT_OFF_URL)
+    async def async_get_auto_shut_off(self, timeout: Optional[float] = None) -> Optional[AutoShutOffState]:
         """GET /api/sonic/auto-shut-off - Get Auto shut off state."""
-        url = self._base_url + AUTO_SHUT_OFF_URL
-        headers = {ACCEPT_HEADER: "application/vnd.wtg.local.auto-shut-off.v1+json"}
-        data = await self._get(url, headers)
-        return AutoShutOffState.from_dict(data) if data else None
+        return await self._request(
+            "GET", self._auto_shut_off_url, AUTO_SHUT_OFF_HEADERS, timeout=timeout, decode=AutoShutOffState.from_dict
+        )
+
+    async def async_poll_all(self, timeout: Optional[float] = None) -> PollSnapshot:
+        """Fetch all GET endpoints of the device concurrently.
+
+        Prefer this to awaiting the getters one after another: the requests share
+        the connection pool, so a poll takes about as long as the slowest one.
+        An endpoint that fails with WatergateApiException is left as None and its
+        exception is recorded in PollSnapshot.errors.
+        """
+        results = await asyncio.gather(
+            self.async_get_device_state(timeout),
+            self.async_get_networking(timeout),
+            self.async_get_telemetry_data(timeout),
+            self.async_get_auto_shut_off(timeout),
+            self.async_get_auto_shut_off_report(timeout),
+            return_exceptions=True,
+        )
+        values = []
+        errors = {}
+        for field, result in zip(POLL_FIELDS, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, WatergateApiException):
+                    raise result
+                errors[field] = result
+                result = None
+            values.append(result)
+        return PollSnapshot(*values, errors)
 
     async def async_patch_auto_shut_off(
-        self, enabled: Optional[bool] = None, duration: Optional[int] = None, volume: Optional[int] = None
+        self,
+        enabled: Optional[bool] = None,
+        duration: Optional[int] = None,
+        volume: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
-        """PATCH /api/sonic/auto-shut-off - Patch auto shut off."""
-        url = self._base_url + AUTO_SHUT_OFF_URL
-        headers = {CONTENT_TYPE_HEADER: "application/vnd.wtg.local.auto-shut-off.v1+json"}
-
-        data = {}
-
-        if enabled is not None:
-            data["enabled"] = enabled
-        if duration is not None:
-            data["durationThreshold"] = duration
-        if volume is not None:
-            data["volumeThreshold"] = volume
-        
-        await self._ensure_session()
-
-        for attempt in RETRY_ATTEMPTS:  # Retry logic
-            try:
-                async with self._session.patch(url, json=data, headers=headers) as response:
-                    if response.status == 204:
-                        return True
-                    _LOGGER.error("Failed to set auto shut off parameter: %s", response.status)
-            except aiohttp.ClientError as e:
-                _LOGGER.error("Network error occurred: %s", e)
-            await asyncio.sleep(1)  # Wait before retrying
-        raise WatergateApiException(f"Failed to patch auto shut off after 3 attempts")
-
-    async def async_get_auto_shut_off_report(self) -> Optional[AutoShutOffReport]:
-        """GET /api/sonic/auto-shut-off/report - Get auto shut-off report."""
-        url = self._base_url + AUTO_SHUT_OFF_REPORT_URL
-        headers = {ACCEPT_HEADER: "application/vnd.wtg.local.auto-shut-off.report.v1+json"}
+        """PATCH /api/sonic/auto-shut-off - Patch auto shut off.
 
-        await self._ensure_session()
+        Raises ValueError when no setting is given, without contacting the device.
+        """
+        url = self._auto_shut_off_url
+        headers = AUTO_SHUT_OFF_PATCH_HEADERS
 
-        for attempt in RETRY_ATTEMPTS:  # Retry logic
-            try:
-                response = await self._session.get(url, headers=headers)
-                if response.status == 200:
-                    data = await response.json()
-                    return AutoShutOffReport.from_dict(data) if data else None
-                if response.status == 204:
-                    return None
-                _LOGGER.error("Failed to fetch data from %s: %s", url, response.status)
-            except aiohttp.ClientError as e:
-                _LOGGER.error("Network error occurred: %s", e)
-            await asyncio.sleep(1)  # Wait before retrying
-        raise WatergateApiException(f"Failed to fetch data from {url} after 3 attempts")
-
-    async def async_set_webhook_url(self, webhook: str) -> bool:
+        data = {
+            key: value
+            for key, value in (("enabled", enabled), ("durationThreshold", duration), ("volumeThreshold", volume))
+            if value is not None
+        }
+        if not data:
+            raise ValueError("At least one auto shut off setting must be provided")
+
+        try:
+            # The thresholds are absolute values, so replaying the PATCH is safe
+            await self._request("PATCH", url, headers, data, timeout=timeout, retry=True)
+        finally:
+            # Invalidate once the device has (possibly) applied the change
+            self._invalidate(AUTO_SHUT_OFF_URL)
+        return True
+
+    async def async_get_auto_shut_off_report(self, timeout: Optional[float] = None) -> Optional[AutoShutOffReport]:
+        """GET /api/sonic/auto-shut-off/report - Get auto shut-off report."""
+        return await self._request(
+            "GET",
+            self._auto_shut_off_report_url,
+            AUTO_SHUT_OFF_REPORT_HEADERS,
+            timeout=timeout,
+            decode=AutoShutOffReport.from_dict,
+        )
+
+    async def async_set_webhook_url(self, webhook: str, timeout: Optional[float] = None) -> bool:
         """PATCH /api/sonic/webhook - Set webhook URL."""
-        url = self._base_url + WEBHOOK_URL
-        headers = {CONTENT_TYPE_HEADER: "application/vnd.wtg.local.webhook.v1+json"}
+        url = self._webhook_url
+        headers = WEBHOOK_HEADERS
         data = {"url": webhook}
-        return await self._put(url, headers, data)
+        await self._request("PUT", url, headers, data, timeout=timeout)
+        return True
 
-    async def async_set_valve_state(self, state: str) -> bool:
+    async def async_set_valve_state(self, state: str, timeout: Optional[float] = None) -> bool:
         """PUT /api/sonic/valve - Set valve state."""
-        url = self._base_url + VALVE_URL
-        headers = {CONTENT_TYPE_HEADER: "application/vnd.wtg.local.valve-change.v1+json"}
+        url = self._valve_url
+        headers = VALVE_HEADERS
         data = {"state": state}
-        return await self._put(url, headers, data)
\ No newline at end of file
+        try:
+            await self._request("PUT", url, headers, data, timeout=timeout)
+        finally:
+            self._invalidate(DEVICE_STATE_URL)
+        return True
\ No newline at end of file